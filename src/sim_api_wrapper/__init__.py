@@ -1,21 +1,27 @@
 """High-level client for interacting with the LRZ SIM API."""
 
+from .async_client import AsyncSimApiClient
+from .batching import BoundedBatcher
 from .client import SimApiClient
 from .models import (
     Institution,
     InstitutionAddress,
     Person,
     ProjectInstitutionLink,
+    ResolvedProject,
     User,
 )
 from .exceptions import SimApiError
 
 __all__ = [
+    "AsyncSimApiClient",
+    "BoundedBatcher",
     "SimApiClient",
     "SimApiError",
     "Institution",
     "InstitutionAddress",
     "Person",
     "ProjectInstitutionLink",
+    "ResolvedProject",
     "User",
 ]
@@ -0,0 +1,194 @@
+"""Response decoders producing the public models directly from raw response bodies.
+
+When the optional ``msgspec`` dependency is installed, person, institution and user responses
+are decoded straight into typed structs in C, skipping the intermediate dicts and
+``from_dict``. Payloads that do not match the expected shape fall back to the generic
+:mod:`json` based path, which also handles all error reporting.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+try:  # pragma: no cover - optional dependency
+    import msgspec
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None
+
+from ._parsing import decode_json, parse_wrapped_single
+from .exceptions import SimApiError
+from .models import (
+    _ADDRESS_FIELDS,
+    _INSTITUTION_FIELDS,
+    _PERSON_FIELDS,
+    _USER_FIELDS,
+    Institution,
+    InstitutionAddress,
+    Person,
+    User,
+)
+
+
+def _decode_person_fallback(body: bytes) -> Person:
+    return Person.from_dict(parse_wrapped_single(decode_json(body)))
+
+
+def _decode_institution_fallback(body: bytes) -> Institution:
+    return Institution.from_dict(parse_wrapped_single(decode_json(body)))
+
+
+def _decode_user_fallback(body: bytes, *, include_daten: bool = True) -> User:
+    data = decode_json(body)
+    if isinstance(data, dict):
+        if not include_daten:
+            data.pop("daten", None)
+        return User.from_dict(data)
+    raise SimApiError("Unexpected response payload for user endpoint")
+
+
+def _decode_user_summary_fallback(body: bytes) -> User:
+    return _decode_user_fallback(body, include_daten=False)
+
+
+if msgspec is not None:
+    # Struct field names match the model field names; ``rename`` maps them to the API keys
+    # listed in the model field tables.
+
+    def _rename(fields: Tuple[Tuple[str, str], ...]) -> Dict[str, str]:
+        return {name: key for key, name in fields if key != name}
+
+    class _PersonStruct(msgspec.Struct, rename=_rename(_PERSON_FIELDS)):
+        lrz_id: Optional[str] = ""
+        benutzername: Optional[str] = None
+        anrede: Optional[str] = None
+        rufname: Optional[str] = None
+        nachname: Optional[str] = None
+        titel_pre: Optional[str] = None
+        titel_post: Optional[str] = None
+        geschlecht: Optional[str] = None
+        kennungen: Tuple[str, ...] = ()
+        status: Optional[str] = None
+
+    class _AddressStruct(msgspec.Struct, rename=_rename(_ADDRESS_FIELDS)):
+        typ: Optional[str] = None
+        strasse: Optional[str] = None
+        plz: Optional[str] = None
+        ort: Optional[str] = None
+        land: Optional[str] = None
+        postfach: Optional[str] = None
+        adresszusatz: Optional[str] = None
+        co: Optional[str] = None
+        person: Optional[str] = None
+        kennung: Optional[str] = None
+        postverteilschluessel: Optional[str] = None
+        adressat1: Optional[str] = None
+        adressat2: Optional[str] = None
+        adressat3: Optional[str] = None
+        adressat4: Optional[str] = None
+        name: Optional[str] = None
+        geerbt: Optional[bool] = None
+        person_link: Optional[str] = None
+
+    class _InstitutionStruct(msgspec.Struct, rename=_rename(_INSTITUTION_FIELDS)):
+        lrz_id: Optional[str] = ""
+        name: Optional[str] = None
+        parent_ids: Tuple[str, ...] = ()
+        parent_links: Tuple[str, ...] = ()
+        bezeichnung: Optional[str] = None
+        nutzerklasse: Optional[str] = None
+        mwnintern: Optional[str] = None
+        kostenabrechnung: Tuple[str, ...] = ()
+        einrichtungsart: Optional[str] = None
+        einrichtungstyp: Optional[str] = None
+        adsorgpraefix: Optional[str] = None
+        status: Optional[str] = None
+        importiert: Optional[str] = None
+        anschriften: Tuple[_AddressStruct, ...] = ()
+        chef_lrz_id: Optional[str] = None
+        chef_links: Tuple[str, ...] = ()
+
+    class _UserSummaryStruct(msgspec.Struct, rename=_rename(_USER_FIELDS)):
+        kennung: Optional[str] = ""
+        lrz_id: Optional[str] = None
+        status: Optional[str] = None
+        status_num: Optional[int] = None
+        validpwd: Optional[int] = None
+        uid: Optional[str] = None
+        gid: Optional[str] = None
+        projekt: Optional[str] = None
+        kennungstyp: Optional[str] = None
+
+    # Users without ``daten`` skip decoding the nested record entirely, which is typically the
+    # largest part of the payload.
+    class _UserStruct(_UserSummaryStruct):
+        daten: Dict[str, Any] = {}
+
+    class _WrappedPerson(msgspec.Struct):
+        code: Any = None
+        message: Any = "Unknown error"
+        data: Union[_PersonStruct, List[_PersonStruct], None] = None
+
+    class _WrappedInstitution(msgspec.Struct):
+        code: Any = None
+        message: Any = "Unknown error"
+        data: Union[_InstitutionStruct, List[_InstitutionStruct], None] = None
+
+    _person_decoder = msgspec.json.Decoder(_WrappedPerson)
+    _institution_decoder = msgspec.json.Decoder(_WrappedInstitution)
+    _user_decoder = msgspec.json.Decoder(_UserStruct)
+    _user_summary_decoder = msgspec.json.Decoder(_UserSummaryStruct)
+    _asdict = msgspec.structs.asdict
+
+    def _unwrap_single(wrapped: Any) -> Any:
+        if wrapped.code != 0:
+            raise SimApiError(f"API returned error code {wrapped.code}: {wrapped.message}")
+        data = wrapped.data
+        if data.__class__ is list:
+            if len(data) != 1:
+                raise SimApiError("Expected exactly one result but received multiple")
+            return data[0]
+        if data is None:
+            raise SimApiError("Unexpected response payload structure")
+        return data
+
+    def decode_person(body: bytes) -> Person:
+        """Decode a wrapped person response."""
+
+        try:
+            wrapped = _person_decoder.decode(body)
+        except msgspec.DecodeError:
+            return _decode_person_fallback(body)
+        return Person(**_asdict(_unwrap_single(wrapped)))
+
+    def decode_institution(body: bytes) -> Institution:
+        """Decode a wrapped institution response."""
+
+        try:
+            wrapped = _institution_decoder.decode(body)
+        except msgspec.DecodeError:
+            return _decode_institution_fallback(body)
+        fields = _asdict(_unwrap_single(wrapped))
+        fields["anschriften"] = tuple(InstitutionAddress(**_asdict(entry)) for entry in fields["anschriften"])
+        return Institution(**fields)
+
+    def decode_user(body: bytes) -> User:
+        """Decode a user response."""
+
+        try:
+            return User(**_asdict(_user_decoder.decode(body)))
+        except msgspec.DecodeError:
+            return _decode_user_fallback(body)
+
+    def decode_user_summary(body: bytes) -> User:
+        """Decode a user response, dropping the nested ``daten`` record."""
+
+        try:
+            return User(**_asdict(_user_summary_decoder.decode(body)))
+        except msgspec.DecodeError:
+            return _decode_user_summary_fallback(body)
+
+else:  # pragma: no cover - exercised only without msgspec
+    decode_person = _decode_person_fallback
+    decode_institution = _decode_institution_fallback
+    decode_user = _decode_user_fallback
+    decode_user_summary = _decode_user_summary_fallback
@@ -0,0 +1,107 @@
+"""Transport-independent helpers for decoding SIM API responses.
+
+These functions are shared by the synchronous and the asynchronous client.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Dict, List
+from urllib import parse as urllib_parse
+
+try:  # pragma: no cover - optional dependency
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+from .exceptions import SimApiError
+
+# Maximum number of body bytes included in error messages for non-JSON error responses.
+ERROR_TEXT_LIMIT = 512
+
+
+def encode_query(params: Dict[str, Any]) -> str:
+    """Return the URL-encoded query string for ``params``."""
+
+    quote = urllib_parse.quote_plus
+    return "&".join(f"{quote(key)}={quote(str(value))}" for key, value in params.items())
+
+
+def decode_json(body: bytes) -> Any:
+    """Decode a JSON response body."""
+
+    try:
+        # Both decoders accept the raw bytes, so the body is never copied into a str first.
+        return orjson.loads(body) if orjson is not None else json.loads(body)
+    except json.JSONDecodeError as exc:  # pragma: no cover - response should be JSON
+        raise SimApiError("Expected JSON response") from exc
+
+
+def coerce_str_list(data: List[Any]) -> List[str]:
+    """Return ``data`` as a list of strings, skipping per-item conversion when the API sent strings."""
+
+    # The decoder yields ``str`` for JSON strings, so checking the first item is sufficient. Each
+    # call decodes a fresh list, so it can be returned as-is.
+    if not data or data[0].__class__ is str:
+        return data
+    return list(map(str, data))
+
+
+# SIM API responses commonly wrap data in a code/message/data structure. The parsers below
+# compare exact types via ``__class__`` since decoded JSON only ever yields plain dicts/lists.
+def unwrap_data(payload: Any) -> Any:
+    """Check the status code of a wrapped response and return its ``data`` member."""
+
+    if payload.__class__ is not dict:
+        raise SimApiError("Unexpected response payload structure")
+
+    code = payload.get("code")
+    if code != 0:
+        message = payload.get("message", "Unknown error")
+        raise SimApiError(f"API returned error code {code}: {message}")
+    return payload.get("data")
+
+
+def parse_wrapped_single(payload: Any) -> Dict[str, Any]:
+    """Return the single entry of a wrapped response."""
+
+    data = unwrap_data(payload)
+    if data.__class__ is dict:
+        return data
+    if data.__class__ is list:
+        if len(data) != 1:
+            raise SimApiError("Expected exactly one result but received multiple")
+        return data[0]
+    raise SimApiError("Unexpected response payload structure")
+
+
+def parse_wrapped_many(payload: Any) -> List[Any]:
+    """Return the entries of a wrapped response as a list."""
+
+    data = unwrap_data(payload)
+    if data.__class__ is list:
+        return data
+    return [] if data is None else [data]
+
+
+def extract_error_message(body: bytes, headers: Dict[str, str], status: int) -> str:
+    """Return a human-readable message for an error response."""
+
+    if not body:
+        return f"Request failed with status {status}"
+
+    if "application/json" in headers.get("Content-Type", ""):
+        try:
+            payload = json.loads(body)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            payload = None
+        if isinstance(payload, dict):
+            message = payload.get("message") or payload.get("error")
+            if message:
+                return str(message)
+
+    # Error pages (e.g. from a proxy) can be large; only decode a prefix to surface a hint.
+    text = str(memoryview(body)[:ERROR_TEXT_LIMIT], "utf-8", "replace").strip()
+    if len(body) > ERROR_TEXT_LIMIT:
+        text += "..."
+    return text or f"Request failed with status {status}"
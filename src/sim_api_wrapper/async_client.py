@@ -0,0 +1,214 @@
+"""Asynchronous client implementation for the LRZ SIM API."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from urllib import parse as urllib_parse
+
+try:  # pragma: no cover - optional dependency
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None
+
+from ._decoders import (
+    decode_institution,
+    decode_person,
+    decode_user,
+    decode_user_summary,
+)
+from ._parsing import (
+    coerce_str_list,
+    decode_json,
+    encode_query,
+    extract_error_message,
+    parse_wrapped_many,
+)
+from .auth import build_basic_auth_header, load_netrc_credentials
+from .client import DEFAULT_BASE_URL, DEFAULT_TIMEOUT, SOLVE_QUERY
+from .exceptions import SimApiError
+from .models import Institution, Person, ProjectInstitutionLink, ResolvedProject, User
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONNECTION_LIMIT = 50
+DEFAULT_KEEPALIVE_TIMEOUT = 60
+
+
+class AsyncSimApiClient:
+    """Asynchronous counterpart of :class:`~sim_api_wrapper.client.SimApiClient` built on aiohttp.
+
+    Useful when many independent lookups should run concurrently, e.g. resolving a batch of
+    projects via :meth:`resolve_many`. Requires the optional ``aiohttp`` dependency.
+    """
+
+    def __init__(
+        self,
+        *,
+        base_url: str = DEFAULT_BASE_URL,
+        timeout: int | float = DEFAULT_TIMEOUT,
+        netrc_path: Optional[str] = None,
+        use_netrc: bool = True,
+        connection_limit: int = DEFAULT_CONNECTION_LIMIT,
+    ) -> None:
+        if aiohttp is None:
+            raise ImportError("AsyncSimApiClient requires aiohttp; install the 'async' extra")
+
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.connection_limit = connection_limit
+        self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+        # aiohttp requests and decodes gzip/deflate responses on its own.
+        self._request_headers: Dict[str, str] = {"Accept": "application/json"}
+        self._session: Optional[aiohttp.ClientSession] = None
+
+        if use_netrc or netrc_path:
+            try:
+                username, password = load_netrc_credentials(self.base_url, netrc_path)
+            except FileNotFoundError:
+                self.logger.debug("No netrc file found; continuing without authentication")
+            except ValueError as exc:
+                self.logger.debug("Skipping netrc credentials: %s", exc)
+            else:
+                auth_header = build_basic_auth_header(username, password)
+                self._request_headers["Authorization"] = auth_header.decode("ascii")
+
+    # -- context manager protocol -------------------------------------------------
+    async def __aenter__(self) -> "AsyncSimApiClient":  # pragma: no cover - context convenience
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:  # pragma: no cover - context convenience
+        await self.close()
+
+    # -- public API methods -------------------------------------------------------
+    async def list_groups(self) -> List[str]:
+        """Return all available project groups."""
+
+        data = await self._request_json("GET", "/service/AI/groups")
+        if isinstance(data, list):
+            return coerce_str_list(data)
+        raise SimApiError("Unexpected response payload for groups endpoint")
+
+    async def get_group_members(self, group_name: str, *, solve: bool = False) -> List[str]:
+        """Return the usernames assigned to the specified group."""
+
+        group = urllib_parse.quote(group_name, safe="")
+        endpoint = f"/service/AI/groups/{group}/members{SOLVE_QUERY[bool(solve)]}"
+        data = await self._request_json("GET", endpoint)
+        if isinstance(data, list):
+            return coerce_str_list(data)
+        raise SimApiError("Unexpected response payload for group members endpoint")
+
+    async def get_project_institution_links(self, project_name: str) -> List[ProjectInstitutionLink]:
+        """Return institution links for the given project name."""
+
+        payload = await self._request_json(
+            "GET",
+            "/einrichtung",
+            params={"projektname": project_name},
+        )
+        entries = parse_wrapped_many(payload)
+        return [ProjectInstitutionLink.from_dict(entry) for entry in entries]
+
+    async def get_institution(self, einrichtungs_id: str) -> Institution:
+        """Fetch details about a specific institution."""
+
+        return await self._request_json("GET", f"/einrichtung/{einrichtungs_id}", decoder=decode_institution)
+
+    async def get_person(self, person_id: str) -> Person:
+        """Fetch information about a person via their LRZ identifier."""
+
+        return await self._request_json("GET", f"/person/{person_id}", decoder=decode_person)
+
+    async def get_user(self, username: str, *, include_daten: bool = True) -> User:
+        """Fetch information about a specific SIM user.
+
+        Pass ``include_daten=False`` to drop the nested ``daten`` record, which saves memory when
+        loading many users.
+        """
+
+        decoder = decode_user if include_daten else decode_user_summary
+        return await self._request_json("GET", f"/user/{username}", decoder=decoder)
+
+    async def resolve_project(self, project_name: str) -> ResolvedProject:
+        """Resolve a project's institutions and their heads, fetching them concurrently."""
+
+        links = await self.get_project_institution_links(project_name)
+        institution_ids = dict.fromkeys(link.einrichtungs_id for link in links if link.einrichtungs_id)
+        institutions = list(
+            await asyncio.gather(*(self.get_institution(lrz_id) for lrz_id in institution_ids))
+        )
+
+        chef_ids = dict.fromkeys(inst.chef_lrz_id for inst in institutions if inst.chef_lrz_id)
+        chefs = list(await asyncio.gather(*(self.get_person(chef_id) for chef_id in chef_ids)))
+
+        return ResolvedProject(
+            projektname=project_name,
+            links=links,
+            institutions=institutions,
+            chefs=chefs,
+        )
+
+    async def resolve_many(self, project_names: Iterable[str]) -> List[ResolvedProject]:
+        """Resolve several projects concurrently, preserving the input order."""
+
+        return list(await asyncio.gather(*(self.resolve_project(name) for name in project_names)))
+
+    # -- internal helpers ---------------------------------------------------------
+    async def close(self) -> None:
+        """Close the underlying HTTP session."""
+
+        self.logger.debug("Closing async SIM API client")
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _request_json(
+        self,
+        method: str,
+        endpoint: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        decoder: Callable[[bytes], Any] = decode_json,
+    ) -> Any:
+        method = method.upper()
+        url = self._build_url(endpoint, params)
+        self.logger.debug("Performing %s request to %s", method, url)
+
+        status, headers, body = await self._open(method, url)
+        self.logger.debug("Received response with status %s", status)
+        if status >= 400:
+            message = extract_error_message(body, headers, status)
+            raise SimApiError(message, status_code=status, headers=headers)
+        return decoder(body)
+
+    def _build_url(self, endpoint: str, params: Optional[Dict[str, Any]]) -> str:
+        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        if not params:
+            return url
+        return f"{url}?{encode_query(params)}"
+
+    async def _open(self, method: str, url: str) -> Tuple[int, Dict[str, str], bytes]:
+        try:
+            async with self._get_session().request(method, url) as response:
+                body = await response.read()
+                return response.status, dict(response.headers), body
+        except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+            self.logger.error("Request to %s failed: %s", url, exc)
+            raise SimApiError(f"Request to {url} failed: {exc}") from exc
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        # The session binds to the running event loop, so it is created on first use.
+        if self._session is None:
+            self._session = aiohttp.ClientSession(
+                headers=self._request_headers,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                # Honour HTTP(S)_PROXY/NO_PROXY like the synchronous client.
+                trust_env=True,
+                connector=aiohttp.TCPConnector(
+                    limit=self.connection_limit,
+                    keepalive_timeout=DEFAULT_KEEPALIVE_TIMEOUT,
+                ),
+            )
+        return self._session
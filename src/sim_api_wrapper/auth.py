@@ -37,8 +37,10 @@ def load_netrc_credentials(base_url: str, netrc_path: Optional[str | Path] = Non
     return login, password
 
 
-def build_basic_auth_header(username: str, password: str) -> str:
-    """Return the HTTP Basic authorization header for the given credentials."""
+def build_basic_auth_header(username: str, password: str) -> bytes:
+    """Return the HTTP Basic authorization header value for the given credentials.
 
-    token = b64encode(f"{username}:{password}".encode("utf-8")).decode("ascii")
-    return f"Basic {token}"
+    The value is returned as bytes, which ``http.client`` sends without re-encoding.
+    """
+
+    return b"Basic " + b64encode(username.encode("utf-8") + b":" + password.encode("utf-8"))
@@ -0,0 +1,98 @@
+"""Bounded, rate-limit aware concurrent execution of SIM API calls."""
+
+from __future__ import annotations
+
+import logging
+import random
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import AbstractContextManager
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Mapping, Optional, TypeVar
+
+from .exceptions import SimApiError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_MAX_INFLIGHT = 8
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_MAX_BACKOFF = 60.0
+
+
+class BoundedBatcher(AbstractContextManager["BoundedBatcher"]):
+    """Run client calls on a thread pool with at most ``max_inflight`` calls pending.
+
+    :meth:`submit` blocks once ``max_inflight`` calls are queued or running, so large batches
+    are issued in waves instead of being queued all at once. Calls rejected with
+    ``429 Too Many Requests`` are retried after the delay given by the ``Retry-After`` header
+    (or an exponential backoff if it is missing), plus a small random jitter.
+    """
+
+    def __init__(
+        self,
+        max_inflight: int = DEFAULT_MAX_INFLIGHT,
+        *,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        max_backoff: float = DEFAULT_MAX_BACKOFF,
+    ) -> None:
+        if max_inflight < 1:
+            raise ValueError("max_inflight must be at least 1")
+        self.max_inflight = max_inflight
+        self.max_retries = max_retries
+        self.max_backoff = max_backoff
+        self._slots = threading.BoundedSemaphore(max_inflight)
+        self._executor = ThreadPoolExecutor(max_workers=max_inflight)
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.shutdown()
+
+    def submit(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> Future[T]:
+        """Schedule ``fn(*args, **kwargs)``, waiting for a free slot if necessary."""
+
+        self._slots.acquire()
+        try:
+            future = self._executor.submit(self._call, fn, *args, **kwargs)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down the underlying thread pool."""
+
+        self._executor.shutdown(wait=wait)
+
+    def _call(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        attempt = 0
+        while True:
+            try:
+                return fn(*args, **kwargs)
+            except SimApiError as exc:
+                if exc.status_code != 429 or attempt >= self.max_retries:
+                    raise
+                delay = min(_retry_after(exc.headers, default=2.0**attempt), self.max_backoff)
+                delay += random.uniform(0, 0.1 * delay + 0.1)
+                attempt += 1
+                logger.warning("Rate limited by the SIM API; retry %d in %.1fs", attempt, delay)
+                time.sleep(delay)
+
+
+def _retry_after(headers: Mapping[str, str], *, default: float) -> float:
+    """Return the delay requested via a ``Retry-After`` header in seconds."""
+
+    value: Optional[str] = next((v for k, v in headers.items() if k.lower() == "retry-after"), None)
+    if not value:
+        return default
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return default
+    return max(retry_at.timestamp() - time.time(), 0.0)
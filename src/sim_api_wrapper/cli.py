@@ -3,11 +3,20 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
 import json
 import logging
-from dataclasses import asdict, is_dataclass
+import sys
+from dataclasses import fields, is_dataclass
 from typing import Any
 
+try:  # pragma: no cover - optional dependency
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+from .async_client import AsyncSimApiClient
+from .batching import DEFAULT_MAX_INFLIGHT
 from .client import DEFAULT_BASE_URL, DEFAULT_TIMEOUT, SimApiClient
 
 
@@ -23,6 +32,16 @@ def configure_logging(verbosity: int) -> None:
     logging.basicConfig(level=level, format="%(levelname)s: %(message)s")
 
 
+def _positive_int(value: str) -> int:
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}") from None
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Interact with the LRZ SIM API.")
     parser.add_argument("--base-url", default=DEFAULT_BASE_URL, help="Override the API base URL.")
@@ -61,6 +80,24 @@ def build_parser() -> argparse.ArgumentParser:
     project = subparsers.add_parser("project-institution", help="Resolve institution links for a project.")
     project.add_argument("project_name", help="Project identifier, e.g. pn69ju.")
 
+    resolve = subparsers.add_parser(
+        "resolve-project",
+        help="Resolve the institutions and their heads for one or more projects.",
+    )
+    resolve.add_argument("project_names", nargs="+", help="Project identifiers, e.g. pn69ju.")
+    resolve.add_argument(
+        "--async",
+        dest="use_async",
+        action="store_true",
+        help="Resolve all projects concurrently using the aiohttp-based client.",
+    )
+    resolve.add_argument(
+        "--max-inflight",
+        type=_positive_int,
+        default=DEFAULT_MAX_INFLIGHT,
+        help="Maximum number of concurrent API requests (default: %(default)s).",
+    )
+
     institution = subparsers.add_parser("institution", help="Fetch institution details by ID.")
     institution.add_argument("institution_id", help="Institution LRZ identifier.")
 
@@ -69,6 +106,11 @@ def build_parser() -> argparse.ArgumentParser:
 
     user = subparsers.add_parser("user", help="Fetch user details by username.")
     user.add_argument("username", help="SIM username / Kennung.")
+    user.add_argument(
+        "--include-daten",
+        action="store_true",
+        help="Include the nested 'daten' record of the user entry.",
+    )
 
     return parser
 
@@ -78,24 +120,37 @@ def main(argv: list[str] | None = None) -> int:
     args = parser.parse_args(argv)
     configure_logging(args.verbose)
 
-    with SimApiClient(
-        base_url=args.base_url,
-        netrc_path=args.netrc,
-        timeout=args.timeout,
-        use_netrc=not args.no_netrc,
-    ) as client:
+    client_options = {
+        "base_url": args.base_url,
+        "netrc_path": args.netrc,
+        "timeout": args.timeout,
+        "use_netrc": not args.no_netrc,
+    }
+
+    if args.command == "resolve-project" and args.use_async:
+        async_options = {**client_options, "connection_limit": args.max_inflight}
+        result = asyncio.run(_resolve_projects_async(args.project_names, async_options))
+        _print_result(result[0] if len(result) == 1 else result)
+        return 0
+
+    with SimApiClient(**client_options) as client:
         if args.command == "groups":
             result = client.list_groups()
         elif args.command == "group-members":
             result = client.get_group_members(args.group_name, solve=args.solve)
         elif args.command == "project-institution":
             result = client.get_project_institution_links(args.project_name)
+        elif args.command == "resolve-project":
+            resolved = [
+                client.resolve_project(name, max_inflight=args.max_inflight) for name in args.project_names
+            ]
+            result = resolved[0] if len(resolved) == 1 else resolved
         elif args.command == "institution":
             result = client.get_institution(args.institution_id)
         elif args.command == "person":
             result = client.get_person(args.person_id)
         elif args.command == "user":
-            result = client.get_user(args.username)
+            result = client.get_user(args.username, include_daten=args.include_daten)
         else:  # pragma: no cover - argparse ensures this is unreachable
             parser.error(f"Unknown command: {args.command}")
 
@@ -103,15 +158,26 @@ def main(argv: list[str] | None = None) -> int:
     return 0
 
 
+async def _resolve_projects_async(project_names: list[str], client_options: dict[str, Any]) -> list[Any]:
+    async with AsyncSimApiClient(**client_options) as client:
+        return await client.resolve_many(project_names)
+
+
 def _print_result(result: Any) -> None:
-    if is_dataclass(result):
-        payload = asdict(result)
-    elif isinstance(result, list) and result and is_dataclass(result[0]):
-        payload = [asdict(item) for item in result]
-    else:
-        payload = result
-
-    print(json.dumps(payload, indent=2, ensure_ascii=False))
+    # Dataclasses are serialised field by field as the encoder reaches them, which avoids the
+    # recursive deep copy ``dataclasses.asdict`` would make first. orjson handles them natively.
+    if orjson is not None:
+        sys.stdout.flush()
+        sys.stdout.buffer.write(orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+        sys.stdout.buffer.flush()
+        return
+    print(json.dumps(result, indent=2, ensure_ascii=False, default=_dataclass_to_dict))
+
+
+def _dataclass_to_dict(obj: Any) -> dict[str, Any]:
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return {f.name: getattr(obj, f.name) for f in fields(obj)}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
 
 if __name__ == "__main__":  # pragma: no cover
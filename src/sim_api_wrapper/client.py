@@ -2,22 +2,46 @@
 
 from __future__ import annotations
 
-import json
+import gzip
+import http.client
 import logging
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from concurrent.futures import Future, as_completed
 from contextlib import AbstractContextManager
-from typing import Any, Dict, List, Optional, Tuple
-from urllib import error as urllib_error
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from urllib import parse as urllib_parse
 from urllib import request as urllib_request
 
+from ._decoders import (
+    decode_institution,
+    decode_person,
+    decode_user,
+    decode_user_summary,
+)
+from ._parsing import (
+    coerce_str_list,
+    decode_json,
+    encode_query,
+    extract_error_message,
+    parse_wrapped_many,
+)
 from .auth import build_basic_auth_header, load_netrc_credentials
+from .batching import DEFAULT_MAX_INFLIGHT, BoundedBatcher
 from .exceptions import SimApiError
-from .models import Institution, Person, ProjectInstitutionLink, User
+from .models import Institution, Person, ProjectInstitutionLink, ResolvedProject, User
 
 logger = logging.getLogger(__name__)
 
 DEFAULT_BASE_URL = "https://simapi.sim.lrz.de"
 DEFAULT_TIMEOUT = 10
+DEFAULT_CACHE_TTL = 60.0
+DEFAULT_CACHE_MAXSIZE = 1024
+
+# Pre-encoded query strings for the group members endpoint, indexed by the ``solve`` flag.
+SOLVE_QUERY = ("?solve=false", "?solve=true")
 
 
 class SimApiClient(AbstractContextManager["SimApiClient"]):
@@ -30,12 +54,41 @@ class SimApiClient(AbstractContextManager["SimApiClient"]):
         timeout: int | float = DEFAULT_TIMEOUT,
         netrc_path: Optional[str] = None,
         use_netrc: bool = True,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+        cache_maxsize: int = DEFAULT_CACHE_MAXSIZE,
     ) -> None:
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
+        self.cache_ttl = cache_ttl
+        self.cache_maxsize = cache_maxsize
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
-        self._auth_header: Optional[str] = None
-        self._default_headers = {"Accept": "application/json"}
+        self._auth_header: Optional[bytes] = None
+        self._default_headers = {"Accept": "application/json", "Accept-Encoding": "gzip, deflate"}
+
+        parsed = urllib_parse.urlsplit(self.base_url)
+        if parsed.scheme not in ("http", "https") or not parsed.hostname:
+            raise ValueError(f"Unsupported base URL {base_url!r}")
+        self._scheme = parsed.scheme
+        self._host = parsed.hostname
+        self._port = parsed.port
+        self._origin = f"{parsed.scheme}://{parsed.netloc}"
+        self._path_prefix = parsed.path.rstrip("/")
+        self._proxy = self._find_proxy()
+        self._proxy_headers: Dict[str, str] = {}
+        if self._proxy is not None and self._proxy.username:
+            # ``set_tunnel`` formats header values with f-strings, so this one must be a str.
+            self._proxy_headers["Proxy-Authorization"] = build_basic_auth_header(
+                urllib_parse.unquote(self._proxy.username),
+                urllib_parse.unquote(self._proxy.password or ""),
+            ).decode("ascii")
+        # Plain HTTP requests through a proxy address the target by its absolute URL; HTTPS
+        # requests are tunnelled via CONNECT and keep the origin-relative path.
+        self._target_prefix = self._origin if self._proxy is not None and self._scheme == "http" else ""
+        self._idle_connections: List[http.client.HTTPConnection] = []
+        self._connections_lock = threading.Lock()
+        self._closed = False
+        self._cache: OrderedDict[Tuple[str, str], Tuple[float, bytes]] = OrderedDict()
+        self._cache_lock = threading.Lock()
 
         if use_netrc or netrc_path:
             try:
@@ -47,6 +100,13 @@ class SimApiClient(AbstractContextManager["SimApiClient"]):
             else:
                 self._auth_header = build_basic_auth_header(username, password)
 
+        # Every request sends the same headers, so assemble them once.
+        self._request_headers: Dict[str, str | bytes] = dict(self._default_headers)
+        if self._auth_header:
+            self._request_headers["Authorization"] = self._auth_header
+        if self._target_prefix:
+            self._request_headers.update(self._proxy_headers)
+
     # -- context manager protocol -------------------------------------------------
     def __enter__(self) -> "SimApiClient":  # pragma: no cover - context convenience
         return self
@@ -60,17 +120,17 @@ class SimApiClient(AbstractContextManager["SimApiClient"]):
 
         data = self._request_json("GET", "/service/AI/groups")
         if isinstance(data, list):
-            return [str(item) for item in data]
+            return coerce_str_list(data)
         raise SimApiError("Unexpected response payload for groups endpoint")
 
     def get_group_members(self, group_name: str, *, solve: bool = False) -> List[str]:
         """Return the usernames assigned to the specified group."""
 
-        endpoint = f"/service/AI/groups/{group_name}/members"
-        params = {"solve": "true" if solve else "false"}
-        data = self._request_json("GET", endpoint, params=params)
+        group = urllib_parse.quote(group_name, safe="")
+        endpoint = f"/service/AI/groups/{group}/members{SOLVE_QUERY[bool(solve)]}"
+        data = self._request_json("GET", endpoint)
         if isinstance(data, list):
-            return [str(item) for item in data]
+            return coerce_str_list(data)
         raise SimApiError("Unexpected response payload for group members endpoint")
 
     def get_project_institution_links(self, project_name: str) -> List[ProjectInstitutionLink]:
@@ -81,36 +141,80 @@ class SimApiClient(AbstractContextManager["SimApiClient"]):
             "/einrichtung",
             params={"projektname": project_name},
         )
-        entries = self._parse_wrapped_data(payload)
+        entries = parse_wrapped_many(payload)
         return [ProjectInstitutionLink.from_dict(entry) for entry in entries]
 
     def get_institution(self, einrichtungs_id: str) -> Institution:
         """Fetch details about a specific institution."""
 
-        payload = self._request_json("GET", f"/einrichtung/{einrichtungs_id}")
-        data = self._parse_wrapped_data(payload, expect_single=True)
-        return Institution.from_dict(data)
+        return self._request_json("GET", f"/einrichtung/{einrichtungs_id}", decoder=decode_institution)
 
     def get_person(self, person_id: str) -> Person:
         """Fetch information about a person via their LRZ identifier."""
 
-        payload = self._request_json("GET", f"/person/{person_id}")
-        data = self._parse_wrapped_data(payload, expect_single=True)
-        return Person.from_dict(data)
+        return self._request_json("GET", f"/person/{person_id}", decoder=decode_person)
+
+    def get_user(self, username: str, *, include_daten: bool = True) -> User:
+        """Fetch information about a specific SIM user.
 
-    def get_user(self, username: str) -> User:
-        """Fetch information about a specific SIM user."""
+        Pass ``include_daten=False`` to drop the nested ``daten`` record, which saves memory when
+        loading many users.
+        """
 
-        data = self._request_json("GET", f"/user/{username}")
-        if isinstance(data, dict):
-            return User.from_dict(data)
-        raise SimApiError("Unexpected response payload for user endpoint")
+        decoder = decode_user if include_daten else decode_user_summary
+        return self._request_json("GET", f"/user/{username}", decoder=decoder)
+
+    def resolve_project(
+        self,
+        project_name: str,
+        *,
+        max_inflight: int = DEFAULT_MAX_INFLIGHT,
+    ) -> ResolvedProject:
+        """Resolve a project's institutions and their heads, fetching them concurrently.
+
+        At most ``max_inflight`` lookups run at once; rate-limited lookups are retried.
+        """
+
+        with BoundedBatcher(max_inflight) as batcher:
+            links = batcher.submit(self.get_project_institution_links, project_name).result()
+            institution_ids = dict.fromkeys(link.einrichtungs_id for link in links if link.einrichtungs_id)
+            institution_futures = [batcher.submit(self.get_institution, lrz_id) for lrz_id in institution_ids]
+            chef_futures: Dict[str, Future[Person]] = {}
+            for future in as_completed(institution_futures):
+                chef_id = future.result().chef_lrz_id
+                if chef_id and chef_id not in chef_futures:
+                    chef_futures[chef_id] = batcher.submit(self.get_person, chef_id)
+
+            institutions = [future.result() for future in institution_futures]
+            chef_ids = dict.fromkeys(inst.chef_lrz_id for inst in institutions if inst.chef_lrz_id)
+            chefs = [chef_futures[chef_id].result() for chef_id in chef_ids]
+
+        return ResolvedProject(
+            projektname=project_name,
+            links=links,
+            institutions=institutions,
+            chefs=chefs,
+        )
+
+    def clear_cache(self) -> None:
+        """Drop all cached GET responses."""
+
+        with self._cache_lock:
+            self._cache.clear()
 
     # -- internal helpers ---------------------------------------------------------
     def close(self) -> None:
-        """Placeholder for compatibility with session-based clients."""
+        """Close all keep-alive connections to the API.
+
+        Connections still in use by other threads are closed once their request completes.
+        """
 
         self.logger.debug("Closing SIM API client")
+        with self._connections_lock:
+            self._closed = True
+            connections, self._idle_connections = self._idle_connections, []
+        for conn in connections:
+            conn.close()
 
     def _request_json(
         self,
@@ -118,85 +222,155 @@ class SimApiClient(AbstractContextManager["SimApiClient"]):
         endpoint: str,
         *,
         params: Optional[Dict[str, Any]] = None,
+        no_cache: bool = False,
+        decoder: Callable[[bytes], Any] = decode_json,
     ) -> Any:
-        url = self._build_url(endpoint, params)
-        self.logger.debug("Performing %s request to %s", method.upper(), url)
-
-        request = urllib_request.Request(url, method=method.upper())
-        for header, value in self._default_headers.items():
-            request.add_header(header, value)
-        if self._auth_header:
-            request.add_header("Authorization", self._auth_header)
-
-        status, headers, body = self._open(request)
+        method = method.upper()
+        path = self._build_url(endpoint, params)
+        use_cache = method == "GET" and not no_cache and self.cache_ttl > 0
+        key = (method, path)
+        # The cache holds raw response bodies; decoding on every call hands each caller its own
+        # objects, so mutating a returned model never affects later results.
+        body = self._cache_get(key) if use_cache else None
+        if body is not None:
+            self.logger.debug("Serving %s %s%s from cache", method, self._origin, path)
+            return decoder(body)
+
+        self.logger.debug("Performing %s request to %s%s", method, self._origin, path)
+
+        status, headers, body = self._open(method, path, self._request_headers)
         self.logger.debug("Received response with status %s", status)
         if status >= 400:
-            message = self._extract_error_message(body, headers, status)
-            raise SimApiError(message, status_code=status)
-
-        try:
-            return json.loads(body.decode("utf-8"))
-        except json.JSONDecodeError as exc:  # pragma: no cover - response should be JSON
-            raise SimApiError("Expected JSON response") from exc
+            message = extract_error_message(body, headers, status)
+            raise SimApiError(message, status_code=status, headers=headers)
+
+        data = decoder(body)
+        if use_cache:
+            self._cache_put(key, body)
+        return data
+
+    def _cache_get(self, key: Tuple[str, str]) -> Optional[bytes]:
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[0] >= self.cache_ttl:
+                del self._cache[key]
+                return None
+            return entry[1]
+
+    def _cache_put(self, key: Tuple[str, str], value: bytes) -> None:
+        now = time.monotonic()
+        with self._cache_lock:
+            self._cache[key] = (now, value)
+            self._cache.move_to_end(key)
+            # Entries are kept in insertion order, so expired ones and those beyond the size
+            # bound are always at the front.
+            while self._cache:
+                oldest_key, (stored_at, _) = next(iter(self._cache.items()))
+                if now - stored_at < self.cache_ttl and len(self._cache) <= self.cache_maxsize:
+                    break
+                del self._cache[oldest_key]
 
     def _build_url(self, endpoint: str, params: Optional[Dict[str, Any]]) -> str:
-        base = f"{self.base_url}/{endpoint.lstrip('/')}"
+        """Return the request target (path and query) relative to the API origin."""
+
+        path = f"{self._path_prefix}/{endpoint.lstrip('/')}"
         if not params:
-            return base
-        query = urllib_parse.urlencode({key: str(value) for key, value in params.items()})
-        return f"{base}?{query}"
+            return path
+        return f"{path}?{encode_query(params)}"
 
-    def _open(self, request: urllib_request.Request) -> Tuple[int, Dict[str, str], bytes]:
+    def _open(
+        self,
+        method: str,
+        path: str,
+        headers: Dict[str, str | bytes],
+    ) -> Tuple[int, Dict[str, str], bytes]:
+        target = f"{self._target_prefix}{path}"
+        conn = self._acquire_connection()
         try:
-            with urllib_request.urlopen(request, timeout=self.timeout) as response:
-                status = response.getcode() or 0
-                headers = dict(response.headers.items())
-                body = response.read()
-                return status, headers, body
-        except urllib_error.HTTPError as exc:
-            body = exc.read()
-            headers = dict(exc.headers.items()) if exc.headers else {}
-            return exc.code, headers, body
-        except urllib_error.URLError as exc:
-            self.logger.error("Request to %s failed: %s", request.full_url, exc.reason)
-            raise SimApiError(f"Request to {request.full_url} failed: {exc.reason}") from exc
-
-    def _parse_wrapped_data(self, payload: Dict[str, Any], *, expect_single: bool = False) -> Any:
-        """SIM API responses commonly wrap data in a code/message/data structure."""
-
-        if not isinstance(payload, dict):
-            raise SimApiError("Unexpected response payload structure")
-
-        code = payload.get("code")
-        if code != 0:
-            message = payload.get("message", "Unknown error")
-            raise SimApiError(f"API returned error code {code}: {message}")
-
-        data = payload.get("data")
-        if expect_single:
-            if isinstance(data, list):
-                if len(data) != 1:
-                    raise SimApiError("Expected exactly one result but received multiple")
-                return data[0]
-            if isinstance(data, dict):
-                return data
-            raise SimApiError("Unexpected response payload structure")
-
-        if data is None:
-            return []
-        if isinstance(data, list):
-            return data
-        return [data]
+            try:
+                response, body = self._send(conn, method, target, headers)
+            except (http.client.BadStatusLine, ConnectionResetError, BrokenPipeError):
+                # The server may drop an idle keep-alive connection; retry once on a fresh one.
+                self.logger.debug("Connection to %s was dropped; reconnecting", self._origin)
+                conn.close()
+                conn = self._new_connection()
+                response, body = self._send(conn, method, target, headers)
+        except (OSError, http.client.HTTPException) as exc:
+            conn.close()
+            self.logger.error("Request to %s%s failed: %s", self._origin, path, exc)
+            raise SimApiError(f"Request to {self._origin}{path} failed: {exc}") from exc
+
+        if response.will_close:
+            conn.close()
+        else:
+            self._release_connection(conn)
+
+        # Look the encoding up on the case-insensitive HTTPMessage before flattening it to a dict.
+        encoding = (response.headers.get("Content-Encoding") or "").strip().lower()
+        if body and encoding in ("gzip", "deflate"):
+            body = self._decompress(body, encoding, path)
+        return response.status, dict(response.headers.items()), body
+
+    def _decompress(self, body: bytes, encoding: str, path: str) -> bytes:
+        try:
+            if encoding == "gzip":
+                return gzip.decompress(body)
+            try:
+                return zlib.decompress(body)
+            except zlib.error:
+                # Some servers send raw deflate data without the zlib wrapper.
+                return zlib.decompress(body, -zlib.MAX_WBITS)
+        except (OSError, EOFError, zlib.error) as exc:
+            raise SimApiError(f"Could not decode {encoding} response from {self._origin}{path}") from exc
 
     @staticmethod
-    def _extract_error_message(body: bytes, headers: Dict[str, str], status: int) -> str:
-        content_type = headers.get("Content-Type", "")
-        text = body.decode("utf-8", errors="ignore") if body else ""
-        if "application/json" in content_type:
-            try:
-                payload = json.loads(text)
-            except json.JSONDecodeError:
-                payload = None
-            if isinstance(payload, dict):
-                return str(payload.get("message") or payload.get("error") or text)
-        return text or f"Request failed with status {status}"
+    def _send(
+        conn: http.client.HTTPConnection,
+        method: str,
+        path: str,
+        headers: Dict[str, str | bytes],
+    ) -> Tuple[http.client.HTTPResponse, bytes]:
+        conn.request(method, path, headers=headers)
+        response = conn.getresponse()
+        return response, response.read()
+
+    def _acquire_connection(self) -> http.client.HTTPConnection:
+        with self._connections_lock:
+            if self._idle_connections:
+                return self._idle_connections.pop()
+        return self._new_connection()
+
+    def _release_connection(self, conn: http.client.HTTPConnection) -> None:
+        with self._connections_lock:
+            if not self._closed:
+                self._idle_connections.append(conn)
+                return
+        conn.close()
+
+    def _new_connection(self) -> http.client.HTTPConnection:
+        if self._proxy is None:
+            self.logger.debug("Opening connection to %s", self._origin)
+            if self._scheme == "https":
+                return http.client.HTTPSConnection(self._host, self._port, timeout=self.timeout)
+            return http.client.HTTPConnection(self._host, self._port, timeout=self.timeout)
+
+        self.logger.debug("Opening connection to %s via proxy %s", self._origin, self._proxy.hostname)
+        proxy_port = self._proxy.port or (443 if self._proxy.scheme == "https" else 80)
+        if self._scheme == "https":
+            conn = http.client.HTTPSConnection(self._proxy.hostname, proxy_port, timeout=self.timeout)
+            conn.set_tunnel(self._host, self._port, headers=self._proxy_headers)
+            return conn
+        return http.client.HTTPConnection(self._proxy.hostname, proxy_port, timeout=self.timeout)
+
+    def _find_proxy(self) -> Optional[urllib_parse.SplitResult]:
+        """Return the proxy configured via ``HTTP(S)_PROXY`` for the API host, honouring ``NO_PROXY``."""
+
+        proxy_url = urllib_request.getproxies().get(self._scheme)
+        if not proxy_url or urllib_request.proxy_bypass(self._host):
+            return None
+        if "://" not in proxy_url:
+            proxy_url = f"http://{proxy_url}"
+        proxy = urllib_parse.urlsplit(proxy_url)
+        return proxy if proxy.hostname else None
@@ -2,13 +2,22 @@
 
 from __future__ import annotations
 
+from typing import Mapping
+
 
 class SimApiError(RuntimeError):
     """Raised when a non-successful response is returned from the API."""
 
-    def __init__(self, message: str, *, status_code: int | None = None) -> None:
+    def __init__(
+        self,
+        message: str,
+        *,
+        status_code: int | None = None,
+        headers: Mapping[str, str] | None = None,
+    ) -> None:
         super().__init__(message)
         self.status_code = status_code
+        self.headers = dict(headers) if headers else {}
 
     def __str__(self) -> str:  # pragma: no cover - trivial wrapper
         if self.status_code is not None:
@@ -3,7 +3,87 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+# (API key, field name) pairs for every field of each model. ``from_dict`` spells these out as
+# keyword arguments, which is faster than unpacking a mapping built from them.
+_ADDRESS_FIELDS: Tuple[Tuple[str, str], ...] = (
+    ("typ", "typ"),
+    ("strasse", "strasse"),
+    ("plz", "plz"),
+    ("ort", "ort"),
+    ("land", "land"),
+    ("postfach", "postfach"),
+    ("adresszusatz", "adresszusatz"),
+    ("co", "co"),
+    ("person", "person"),
+    ("kennung", "kennung"),
+    ("postverteilschluessel", "postverteilschluessel"),
+    ("adressat1", "adressat1"),
+    ("adressat2", "adressat2"),
+    ("adressat3", "adressat3"),
+    ("adressat4", "adressat4"),
+    ("name", "name"),
+    ("geerbt", "geerbt"),
+    ("person_link", "person_link"),
+)
+
+_INSTITUTION_FIELDS: Tuple[Tuple[str, str], ...] = (
+    ("LRZid", "lrz_id"),
+    ("name", "name"),
+    ("parent_lrzId", "parent_ids"),
+    ("parent_link", "parent_links"),
+    ("bezeichnung", "bezeichnung"),
+    ("nutzerklasse", "nutzerklasse"),
+    ("mwnintern", "mwnintern"),
+    ("kostenabrechnung", "kostenabrechnung"),
+    ("einrichtungsart", "einrichtungsart"),
+    ("einrichtungstyp", "einrichtungstyp"),
+    ("adsorgpraefix", "adsorgpraefix"),
+    ("status", "status"),
+    ("importiert", "importiert"),
+    ("anschriften", "anschriften"),
+    ("chef_lrzId", "chef_lrz_id"),
+    ("chef_link", "chef_links"),
+)
+
+_PERSON_FIELDS: Tuple[Tuple[str, str], ...] = (
+    ("LRZid", "lrz_id"),
+    ("benutzername", "benutzername"),
+    ("anrede", "anrede"),
+    ("rufname", "rufname"),
+    ("nachname", "nachname"),
+    ("titelPre", "titel_pre"),
+    ("titelPost", "titel_post"),
+    ("geschlecht", "geschlecht"),
+    ("kennungen", "kennungen"),
+    ("status", "status"),
+)
+
+_USER_FIELDS: Tuple[Tuple[str, str], ...] = (
+    ("kennung", "kennung"),
+    ("mwnlrzid", "lrz_id"),
+    ("status", "status"),
+    ("status_num", "status_num"),
+    ("validpwd", "validpwd"),
+    ("uid", "uid"),
+    ("gid", "gid"),
+    ("projekt", "projekt"),
+    ("kennungstyp", "kennungstyp"),
+    ("daten", "daten"),
+)
+
+
+def _as_tuple(value: Any) -> Tuple[Any, ...]:
+    """Return ``value`` as a tuple, using the shared empty tuple for missing or empty values."""
+
+    return tuple(value) if value else ()
+
+
+def _parse_addresses(entries: Any) -> Tuple["InstitutionAddress", ...]:
+    if not entries:
+        return ()
+    return tuple(InstitutionAddress.from_dict(entry) for entry in entries)
 
 
 @dataclass(slots=True)
@@ -76,40 +156,40 @@ class Institution:
 
     lrz_id: str
     name: Optional[str] = None
-    parent_ids: List[str] = field(default_factory=list)
-    parent_links: List[str] = field(default_factory=list)
+    parent_ids: Tuple[str, ...] = ()
+    parent_links: Tuple[str, ...] = ()
     bezeichnung: Optional[str] = None
     nutzerklasse: Optional[str] = None
     mwnintern: Optional[str] = None
-    kostenabrechnung: List[str] = field(default_factory=list)
+    kostenabrechnung: Tuple[str, ...] = ()
     einrichtungsart: Optional[str] = None
     einrichtungstyp: Optional[str] = None
     adsorgpraefix: Optional[str] = None
     status: Optional[str] = None
     importiert: Optional[str] = None
-    anschriften: List[InstitutionAddress] = field(default_factory=list)
+    anschriften: Tuple[InstitutionAddress, ...] = ()
     chef_lrz_id: Optional[str] = None
-    chef_links: List[str] = field(default_factory=list)
+    chef_links: Tuple[str, ...] = ()
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Institution":
         return cls(
             lrz_id=data.get("LRZid", ""),
             name=data.get("name"),
-            parent_ids=list(data.get("parent_lrzId", []) or []),
-            parent_links=list(data.get("parent_link", []) or []),
+            parent_ids=_as_tuple(data.get("parent_lrzId")),
+            parent_links=_as_tuple(data.get("parent_link")),
             bezeichnung=data.get("bezeichnung"),
             nutzerklasse=data.get("nutzerklasse"),
             mwnintern=data.get("mwnintern"),
-            kostenabrechnung=list(data.get("kostenabrechnung", []) or []),
+            kostenabrechnung=_as_tuple(data.get("kostenabrechnung")),
             einrichtungsart=data.get("einrichtungsart"),
             einrichtungstyp=data.get("einrichtungstyp"),
             adsorgpraefix=data.get("adsorgpraefix"),
             status=data.get("status"),
             importiert=data.get("importiert"),
-            anschriften=[InstitutionAddress.from_dict(entry) for entry in data.get("anschriften", [])],
+            anschriften=_parse_addresses(data.get("anschriften")),
             chef_lrz_id=data.get("chef_lrzId"),
-            chef_links=list(data.get("chef_link", []) or []),
+            chef_links=_as_tuple(data.get("chef_link")),
         )
 
 
@@ -125,7 +205,7 @@ class Person:
     titel_pre: Optional[str] = None
     titel_post: Optional[str] = None
     geschlecht: Optional[str] = None
-    kennungen: List[str] = field(default_factory=list)
+    kennungen: Tuple[str, ...] = ()
     status: Optional[str] = None
 
     @classmethod
@@ -139,7 +219,7 @@ class Person:
             titel_pre=data.get("titelPre"),
             titel_post=data.get("titelPost"),
             geschlecht=data.get("geschlecht"),
-            kennungen=list(data.get("kennungen", []) or []),
+            kennungen=_as_tuple(data.get("kennungen")),
             status=data.get("status"),
         )
 
@@ -173,3 +253,13 @@ class User:
             kennungstyp=data.get("kennungstyp"),
             daten=data.get("daten", {}),
         )
+
+
+@dataclass(slots=True)
+class ResolvedProject:
+    """A project together with its institutions and their heads."""
+
+    projektname: str
+    links: List[ProjectInstitutionLink] = field(default_factory=list)
+    institutions: List[Institution] = field(default_factory=list)
+    chefs: List[Person] = field(default_factory=list)
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any, Callable, Dict, Tuple
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from sim_api_wrapper.async_client import AsyncSimApiClient
+from sim_api_wrapper.client import DEFAULT_BASE_URL
+from sim_api_wrapper.exceptions import SimApiError
+
+ResponseTuple = Tuple[int, Dict[str, str], bytes]
+
+
+@pytest.fixture()
+def register_response(monkeypatch: pytest.MonkeyPatch) -> Callable[..., None]:
+    responses: Dict[str, ResponseTuple] = {}
+
+    async def fake_open(self: AsyncSimApiClient, method: str, url: str) -> ResponseTuple:
+        try:
+            return responses[url]
+        except KeyError as exc:  # pragma: no cover - defensive guard
+            raise AssertionError(f"Unexpected URL requested: {url}") from exc
+
+    monkeypatch.setattr(AsyncSimApiClient, "_open", fake_open)
+
+    def registrar(url: str, *, status: int = 200, json_data: Any = None) -> None:
+        body = json.dumps(json_data).encode("utf-8")
+        responses[url] = (status, {"Content-Type": "application/json"}, body)
+
+    return registrar
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_get_group_members(register_response) -> None:
+    register_response(
+        f"{DEFAULT_BASE_URL}/service/AI/groups/pn69ju-ai-c/members?solve=true",
+        json_data=["di25koy", "di29xub"],
+    )
+    client = AsyncSimApiClient(use_netrc=False)
+
+    assert run(client.get_group_members("pn69ju-ai-c", solve=True)) == ["di25koy", "di29xub"]
+
+
+def test_resolve_many(register_response) -> None:
+    for project, lrz_id in (("pn69ju", "0000000000E4EE4B"), ("pn12ab", "0000000000E4EE4C")):
+        register_response(
+            f"{DEFAULT_BASE_URL}/einrichtung?projektname={project}",
+            json_data={"code": 0, "data": [{"projektname": project, "einrichtungsId": lrz_id}]},
+        )
+        register_response(
+            f"{DEFAULT_BASE_URL}/einrichtung/{lrz_id}",
+            json_data={"code": 0, "data": {"LRZid": lrz_id, "chef_lrzId": "00000000001F17E0"}},
+        )
+    register_response(
+        f"{DEFAULT_BASE_URL}/person/00000000001F17E0",
+        json_data={"code": 0, "data": {"LRZid": "00000000001F17E0", "benutzername": "barekzai"}},
+    )
+    client = AsyncSimApiClient(use_netrc=False)
+
+    resolved = run(client.resolve_many(["pn69ju", "pn12ab"]))
+
+    assert [project.projektname for project in resolved] == ["pn69ju", "pn12ab"]
+    assert [project.institutions[0].lrz_id for project in resolved] == ["0000000000E4EE4B", "0000000000E4EE4C"]
+    assert resolved[0].chefs[0].benutzername == "barekzai"
+
+
+def test_error_handling(register_response) -> None:
+    register_response(f"{DEFAULT_BASE_URL}/user/unknown", status=404, json_data={"message": "Not found"})
+    client = AsyncSimApiClient(use_netrc=False)
+
+    with pytest.raises(SimApiError, match="Not found"):
+        run(client.get_user("unknown"))
@@ -0,0 +1,7 @@
+from __future__ import annotations
+
+from sim_api_wrapper.auth import build_basic_auth_header
+
+
+def test_build_basic_auth_header() -> None:
+    assert build_basic_auth_header("di38qex", "pässwort") == b"Basic ZGkzOHFleDpww6Rzc3dvcnQ="
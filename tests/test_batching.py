@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import threading
+from typing import List
+
+import pytest
+
+from sim_api_wrapper import batching
+from sim_api_wrapper.batching import BoundedBatcher
+from sim_api_wrapper.exceptions import SimApiError
+
+
+@pytest.fixture()
+def sleeps(monkeypatch: pytest.MonkeyPatch) -> List[float]:
+    recorded: List[float] = []
+    monkeypatch.setattr(batching.time, "sleep", recorded.append)
+    monkeypatch.setattr(batching.random, "uniform", lambda a, b: 0.0)
+    return recorded
+
+
+def test_retries_after_rate_limit(sleeps: List[float]) -> None:
+    calls = []
+
+    def lookup(name: str) -> str:
+        calls.append(name)
+        if len(calls) == 1:
+            raise SimApiError("Too many requests", status_code=429, headers={"Retry-After": "3"})
+        return name.upper()
+
+    with BoundedBatcher(2) as batcher:
+        assert batcher.submit(lookup, "pn69ju").result() == "PN69JU"
+
+    assert calls == ["pn69ju", "pn69ju"]
+    assert sleeps == [3.0]
+
+
+def test_gives_up_after_max_retries(sleeps: List[float]) -> None:
+    def lookup() -> None:
+        raise SimApiError("Too many requests", status_code=429)
+
+    with BoundedBatcher(1, max_retries=2) as batcher:
+        future = batcher.submit(lookup)
+        with pytest.raises(SimApiError):
+            future.result()
+
+    assert sleeps == [1.0, 2.0]
+
+
+def test_limits_concurrent_calls() -> None:
+    lock = threading.Lock()
+    active = peak = 0
+
+    def lookup(value: int) -> int:
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        threading.Event().wait(0.01)
+        with lock:
+            active -= 1
+        return value
+
+    with BoundedBatcher(3) as batcher:
+        futures = [batcher.submit(lookup, value) for value in range(12)]
+        assert [future.result() for future in futures] == list(range(12))
+
+    assert peak <= 3
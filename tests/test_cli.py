@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import json
+from dataclasses import asdict
+
+import pytest
+
+from sim_api_wrapper import cli
+from sim_api_wrapper.models import Institution, InstitutionAddress
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_print_result_serialises_nested_dataclasses(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str], use_orjson: bool
+) -> None:
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(cli, "orjson", None)
+    institution = Institution(
+        lrz_id="0000000000E4EE4B",
+        name="Leibniz-Rechenzentrum",
+        anschriften=(InstitutionAddress(ort="Garching", geerbt=True),),
+    )
+
+    cli._print_result([institution])
+
+    expected = json.loads(json.dumps([asdict(institution)]))
+    assert json.loads(capsys.readouterr().out) == expected
+
+
+@pytest.mark.parametrize("value", ["0", "-1", "many"])
+def test_max_inflight_must_be_positive(capsys: pytest.CaptureFixture[str], value: str) -> None:
+    with pytest.raises(SystemExit):
+        cli.build_parser().parse_args(["resolve-project", "pn69ju", "--max-inflight", value])
+
+    assert "--max-inflight" in capsys.readouterr().err
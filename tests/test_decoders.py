@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import dataclasses
+from typing import Tuple
+
+import pytest
+
+pytest.importorskip("msgspec")
+
+from sim_api_wrapper import _decoders, models
+from sim_api_wrapper.models import Institution, InstitutionAddress, Person, User
+
+STRUCT_TABLES = [
+    (_decoders._AddressStruct, InstitutionAddress, models._ADDRESS_FIELDS),
+    (_decoders._InstitutionStruct, Institution, models._INSTITUTION_FIELDS),
+    (_decoders._PersonStruct, Person, models._PERSON_FIELDS),
+    (_decoders._UserStruct, User, models._USER_FIELDS),
+]
+
+
+@pytest.mark.parametrize(("struct", "model", "table"), STRUCT_TABLES)
+def test_structs_match_model_fields(struct: type, model: type, table: Tuple[Tuple[str, str], ...]) -> None:
+    assert struct.__struct_fields__ == tuple(f.name for f in dataclasses.fields(model))
+
+
+@pytest.mark.parametrize(("struct", "model", "table"), STRUCT_TABLES)
+def test_structs_decode_the_tabled_api_keys(struct: type, model: type, table: Tuple[Tuple[str, str], ...]) -> None:
+    assert struct.__struct_encode_fields__ == tuple(key for key, _ in table)
+
+
+def test_user_summary_struct_only_omits_daten() -> None:
+    expected = tuple(f.name for f in dataclasses.fields(User) if f.name != "daten")
+
+    assert _decoders._UserSummaryStruct.__struct_fields__ == expected
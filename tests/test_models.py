@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import dataclasses
+from typing import Any, Tuple
+
+import pytest
+
+from sim_api_wrapper import models
+from sim_api_wrapper.models import Institution, InstitutionAddress, Person, User
+
+MODEL_TABLES = [
+    (InstitutionAddress, models._ADDRESS_FIELDS),
+    (Institution, models._INSTITUTION_FIELDS),
+    (Person, models._PERSON_FIELDS),
+    (User, models._USER_FIELDS),
+]
+
+
+@pytest.mark.parametrize(("model", "table"), MODEL_TABLES)
+def test_field_tables_cover_every_model_field(model: type, table: Tuple[Tuple[str, str], ...]) -> None:
+    assert tuple(name for _, name in table) == tuple(f.name for f in dataclasses.fields(model))
+
+
+@pytest.mark.parametrize(("model", "table"), MODEL_TABLES)
+def test_from_dict_reads_the_tabled_api_keys(model: type, table: Tuple[Tuple[str, str], ...]) -> None:
+    # A one-element tuple passes through both the scalar and the list-valued fields unchanged.
+    payload: dict[str, Any] = {key: (f"value of {key}",) for key, _ in table}
+    expected = {name: payload[key] for key, name in table}
+    if model is Institution:
+        payload["anschriften"] = [{"typ": "Post"}]
+        expected["anschriften"] = (InstitutionAddress(typ="Post"),)
+
+    assert dataclasses.asdict(model.from_dict(payload)) == dataclasses.asdict(model(**expected))